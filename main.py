@@ -1,7 +1,13 @@
 # Python
+import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional
 from enum import Enum
 
+# orjson
+import orjson
+
 # Pydantic
 from pydantic import BaseModel
 from pydantic import Field
@@ -11,10 +17,27 @@ from pydantic import EmailStr, SecretStr, PaymentCardNumber
 from fastapi import FastAPI
 from fastapi import status
 from fastapi import HTTPException
+from fastapi import Response
 from fastapi import Body, Query, Path, Form, Header, Cookie, UploadFile, File
+from fastapi.responses import ORJSONResponse
+
+
+# Startup
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Validate each model once with its example so the lazily initialized
+    # validators (email, card number...) are ready before the first request
+    Person(**Person.Config.schema_extra['example'])
+    Location(**Location.Config.schema_extra['example'])
+    PersonOut(**BasePerson.Config.schema_extra['example'])
+    LoginOut(username='warmup')
+    # Build the OpenAPI schema now so the first visit to /docs doesn't pay for it
+    app.openapi()
+    yield
 
-app = FastAPI()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 
 # Models
@@ -150,13 +173,17 @@ class LoginOut(BaseModel):
 
 
 # Path operations
+
+HOME_CONTENT = orjson.dumps({'Hello': 'World'})
+
+
 @app.get(
     path='/',
     status_code=status.HTTP_200_OK,
     tags=['Home'],
     summary='Home section'
 )
-def home():
+async def home():
     """
     ## Home
 
@@ -164,18 +191,18 @@ def home():
 
     Returns a JSON with the phrase "hello world".
     """
-    return {'Hello': 'World'}
+    return Response(content=HOME_CONTENT, media_type='application/json')
 
 
 # Request and response body
 @app.post(
     path='/person/new',
-    response_model=PersonOut,
+    responses={status.HTTP_201_CREATED: {'model': PersonOut}},
     status_code=status.HTTP_201_CREATED,
     tags=['People'],
     summary='Create a person in the app'
 )
-def create_person(person: Person = Body(...)):
+async def create_person(person: Person = Body(...)):
     """
     ## Create Person
 
@@ -189,7 +216,7 @@ def create_person(person: Person = Body(...)):
 
     Returns a person model with first name, last name, age, email, hair color, marital status card number and password.
     """
-    return person
+    return PersonOut.construct(**person.dict(exclude={'password', 'card_number'}))
 
 
 # Validations: Query Parameters
@@ -200,7 +227,7 @@ def create_person(person: Person = Body(...)):
     summary='Show a person in the app',
     deprecated=True
 )
-def show_person(
+async def show_person_by_query(
     name: Optional[str] = Query(
         None,
         min_length=1,
@@ -235,7 +262,12 @@ def show_person(
 
 # Validations: Path Parameters
 
-people = [1, 2, 3, 4, 5]
+PEOPLE_IDS = frozenset((1, 2, 3, 4, 5))
+
+
+@lru_cache(maxsize=1024)
+def render_person_exists(person_id: int) -> bytes:
+    return orjson.dumps({person_id: 'It exists!'}, option=orjson.OPT_NON_STR_KEYS)
 
 
 @app.get(
@@ -244,7 +276,7 @@ people = [1, 2, 3, 4, 5]
     tags=['People'],
     summary='Show a person in the app'
 )
-def show_person(
+async def show_person_by_id(
     person_id: int = Path(
         ...,
         gt=0,
@@ -268,12 +300,15 @@ def show_person(
 
     It raises an exception 404 if the person is not in the database.
     """
-    if person_id not in people:
+    if person_id not in PEOPLE_IDS:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail='This person does not exist.'
         )
-    return {person_id: 'It exists!'}
+    return Response(
+        content=render_person_exists(person_id),
+        media_type='application/json'
+    )
 
 
 # Validations: Request Body
@@ -283,7 +318,7 @@ def show_person(
     tags=['People'],
     summary='Update a person in the app'
 )
-def update_person(
+async def update_person(
     person_id: int = Path(
         ...,
         title='Person ID',
@@ -312,20 +347,21 @@ def update_person(
 
     Returns a JSON with the models person and location combined.
     """
-    results = person.dict()
-    results.update(location.dict())
-    return results
+    return {**person.__dict__, **location.__dict__}
 
 
 @app.post(
     path='/login',
-    response_model=LoginOut,
+    responses={status.HTTP_200_OK: {'model': LoginOut}},
     status_code=status.HTTP_200_OK,
     tags=['People'],
     summary='Login in to the app'
 )
-def login(
-        username: str = Form(...),
+async def login(
+        username: str = Form(
+            ...,
+            max_length=20
+        ),
         password: str = Form(...)
 ):
     """
@@ -342,7 +378,7 @@ def login(
 
     Returns a login model with the person's username and a message.
     """
-    return LoginOut(username=username)
+    return LoginOut.construct(username=username)
 
 
 # Cookies and headers parameters
@@ -353,7 +389,7 @@ def login(
     tags=['Contact'],
     summary='Contact the people who manage the API'
 )
-def contact(
+async def contact(
     first_name: str = Form(
         ...,
         max_length=20,
@@ -401,7 +437,7 @@ def contact(
     tags=['Upload'],
     summary='Post an image in the app'
 )
-def post_image(
+async def post_image(
     image: UploadFile = File(...)
 ):
     """
@@ -417,8 +453,12 @@ def post_image(
 
     Returns a JSON with information about the uploaded image: Filename, Format and Size in KB.
     """
+    # Measure the file by seeking to its end instead of reading it into memory
+    image.file.seek(0, os.SEEK_END)
+    size = image.file.tell()
+    await image.seek(0)
     return {
         'Filename': image.filename,
         'Format': image.content_type,
-        'Size(KB)': round(len(image.file.read())/1024, ndigits=2)
+        'Size(KB)': round(size/1024, ndigits=2)
     }